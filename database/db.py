@@ -58,5 +58,63 @@ def create_tables():
     """
     )
 
+    # Create product change log holding the latest change per product;
+    # each write replaces the row with a new seq, deletes stay as tombstones
+    cursor.execute(
+        """
+    CREATE TABLE IF NOT EXISTS product_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_id INTEGER NOT NULL UNIQUE,
+        change_type TEXT NOT NULL,
+        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """
+    )
+
+    # Record every product write in the change log. The update trigger only
+    # fires for data columns, so its own updated_at write cannot re-fire it
+    # even with PRAGMA recursive_triggers on.
+    cursor.execute(
+        """
+    CREATE TRIGGER IF NOT EXISTS products_after_insert
+    AFTER INSERT ON products
+    BEGIN
+        INSERT OR REPLACE INTO product_changes (product_id, change_type)
+        VALUES (NEW.id, 'insert');
+    END
+    """
+    )
+    cursor.execute(
+        """
+    CREATE TRIGGER IF NOT EXISTS products_after_update
+    AFTER UPDATE OF name, quantity, price, description ON products
+    BEGIN
+        UPDATE products SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+        INSERT OR REPLACE INTO product_changes (product_id, change_type)
+        VALUES (NEW.id, 'update');
+    END
+    """
+    )
+    cursor.execute(
+        """
+    CREATE TRIGGER IF NOT EXISTS products_after_delete
+    AFTER DELETE ON products
+    BEGIN
+        INSERT OR REPLACE INTO product_changes (product_id, change_type)
+        VALUES (OLD.id, 'delete');
+    END
+    """
+    )
+
+    # Seed the change log with products created before it existed
+    cursor.execute(
+        """
+    INSERT INTO product_changes (product_id, change_type)
+    SELECT id, 'insert' FROM products
+    WHERE NOT EXISTS (SELECT 1 FROM product_changes)
+    ORDER BY id
+    """
+    )
+
     conn.commit()
     conn.close()
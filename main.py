@@ -6,9 +6,11 @@ from services.auth_service import register_user, login_user
 from services.inventory_service import (
     add_product,
     get_all_products,
+    get_product,
     update_stock,
     delete_product,
 )
+from services.search_service import search_product_index
 from services.payment_service import simulate_payment
 from database.db import create_tables
 
@@ -349,14 +351,16 @@ def render_add_product_tab():
 
 def render_update_stock_tab():
     st.subheader("Update Stock")
-    products = get_all_products()
-    if products:
-        product_options = {f"{p.id}: {p.name}" : p.id for p in products}
+    search_query = st.text_input("Find Product", placeholder="Type a product name or ID...", key="update_search")
+    matches = search_product_index(search_query)
+    if matches:
+        product_options = {f"{m.id}: {m.name}" : m.id for m in matches}
         with st.form(key="update_stock_form"):
             selected_product = st.selectbox("Select Product", list(product_options.keys()), key="update_product")
             product_id = product_options[selected_product]
             
-            current_quantity = next((p.quantity for p in products if p.id == product_id), 0)
+            product = get_product(product_id)
+            current_quantity = product.quantity if product else 0
             st.write(f"Current quantity: {current_quantity}")
             
             new_quantity = st.number_input("New Quantity", min_value=0, value=current_quantity, step=1, key="update_quantity")
@@ -366,19 +370,22 @@ def render_update_stock_tab():
                     time.sleep(0.5)
                     update_stock(product_id, new_quantity)
                     show_success(f"Stock updated to {new_quantity}")
+    elif search_query:
+        st.info("No products match your search")
     else:
         st.info("No products available to update")
 
 def render_delete_product_tab():
     st.subheader("Delete Product")
-    products = get_all_products()
-    if products:
-        product_options = {f"{p.id}: {p.name}" : p.id for p in products}
+    search_query = st.text_input("Find Product", placeholder="Type a product name or ID...", key="delete_search")
+    matches = search_product_index(search_query)
+    if matches:
+        product_options = {f"{m.id}: {m.name}" : m.id for m in matches}
         with st.form(key="delete_product_form"):
             selected_product = st.selectbox("Select Product", list(product_options.keys()), key="delete_product")
             product_id = product_options[selected_product]
             
-            product = next((p for p in products if p.id == product_id), None)
+            product = get_product(product_id)
             if product:
                 st.write(f"**Name:** {product.name}")
                 st.write(f"**Quantity:** {product.quantity}")
@@ -391,6 +398,8 @@ def render_delete_product_tab():
                         delete_product(product_id)
                         show_success("Product deleted successfully")
                         st.session_state["confirm_delete"] = False
+    elif search_query:
+        st.info("No products match your search")
     else:
         st.info("No products available to delete")
 
@@ -1,9 +1,15 @@
 from database.db import get_db_connection
+from services.search_service import index_product, unindex_product
 from collections import namedtuple
 
 # Define a Product namedtuple for easier data handling
 Product = namedtuple("Product", ["id", "name", "quantity", "price"])
 
+# Define a ProductChange namedtuple for the change feed
+ProductChange = namedtuple(
+    "ProductChange", ["cursor", "product_id", "change_type", "product"]
+)
+
 
 def add_product(name, quantity, price, description=""):
     """Add a new product to the inventory."""
@@ -14,8 +20,10 @@ def add_product(name, quantity, price, description=""):
         "INSERT INTO products (name, quantity, price, description) VALUES (?, ?, ?, ?)",
         (name, quantity, price, description),
     )
+    product_id = cursor.lastrowid
     conn.commit()
     conn.close()
+    index_product(product_id, name)
     return True
 
 
@@ -74,6 +82,7 @@ def delete_product(product_id):
     cursor.execute("DELETE FROM products WHERE id = ?", (product_id,))
     conn.commit()
     conn.close()
+    unindex_product(product_id)
     return True
 
 
@@ -93,3 +102,44 @@ def search_products(query):
 
     conn.close()
     return products
+
+
+def get_changes_since(cursor=0, batch_size=500):
+    """Yield the latest change for each product written after `cursor`.
+
+    The change log keeps one row per product, so changes are streamed in
+    cursor order without scanning older history. Pass the last seen `cursor`
+    back in to resume; deleted products come through with `product` set to
+    None.
+    """
+    while True:
+        conn = get_db_connection()
+        db_cursor = conn.cursor()
+
+        db_cursor.execute(
+            """
+            SELECT c.seq, c.product_id, c.change_type, p.name, p.quantity, p.price
+            FROM product_changes c
+            LEFT JOIN products p ON p.id = c.product_id
+            WHERE c.seq > ?
+            ORDER BY c.seq
+            LIMIT ?
+            """,
+            (cursor, batch_size),
+        )
+        rows = db_cursor.fetchall()
+        conn.close()
+
+        for row in rows:
+            product = None
+            if row[2] != "delete" and row[3] is not None:
+                product = Product(
+                    id=row[1], name=row[3], quantity=row[4], price=row[5]
+                )
+            cursor = row[0]
+            yield ProductChange(
+                cursor=row[0], product_id=row[1], change_type=row[2], product=product
+            )
+
+        if len(rows) < batch_size:
+            return
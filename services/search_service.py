@@ -0,0 +1,104 @@
+import bisect
+import re
+import threading
+from collections import namedtuple
+from database.db import get_db_connection
+
+# Define a ProductMatch namedtuple for typeahead results
+ProductMatch = namedtuple("ProductMatch", ["id", "name"])
+
+# In-memory prefix index, built lazily and kept up to date on writes
+_index_lock = threading.Lock()
+_index = None
+
+
+def _index_keys(product_id, name):
+    """Return the ID, full name and every word in the name as index keys."""
+    lowered = name.lower()
+    keys = {str(product_id), lowered}
+    keys.update(token for token in re.split(r"\W+", lowered) if token)
+    return keys
+
+
+def _build_index():
+    """Build a sorted prefix index over product IDs and names."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT id, name FROM products")
+    rows = cursor.fetchall()
+    conn.close()
+
+    entries = []
+    names = {}
+    for row in rows:
+        product_id, name = row[0], row[1]
+        names[product_id] = name
+        entries.extend((key, product_id) for key in _index_keys(product_id, name))
+
+    entries.sort()
+    return entries, names
+
+
+def _remove_entries(entries, names, product_id):
+    """Remove a product's keys from a loaded index."""
+    name = names.pop(product_id, None)
+    if name is None:
+        return
+    for key in _index_keys(product_id, name):
+        position = bisect.bisect_left(entries, (key, product_id))
+        if position < len(entries) and entries[position] == (key, product_id):
+            del entries[position]
+
+
+def index_product(product_id, name):
+    """Add or rename a product in the index, if it has been built."""
+    with _index_lock:
+        if _index is None:
+            return
+        entries, names = _index
+        _remove_entries(entries, names, product_id)
+        names[product_id] = name
+        for key in _index_keys(product_id, name):
+            bisect.insort(entries, (key, product_id))
+
+
+def unindex_product(product_id):
+    """Remove a product from the index, if it has been built."""
+    with _index_lock:
+        if _index is None:
+            return
+        entries, names = _index
+        _remove_entries(entries, names, product_id)
+
+
+def invalidate_product_index():
+    """Drop the product index so the next lookup rebuilds it."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def search_product_index(query, limit=20):
+    """Return up to `limit` products whose ID or name starts with `query`."""
+    global _index
+    prefix = (query or "").strip().lower()
+    matches = []
+    seen = set()
+
+    with _index_lock:
+        if _index is None:
+            _index = _build_index()
+        entries, names = _index
+
+        position = bisect.bisect_left(entries, (prefix,))
+        while position < len(entries) and len(matches) < limit:
+            key, product_id = entries[position]
+            if not key.startswith(prefix):
+                break
+            if product_id not in seen:
+                seen.add(product_id)
+                matches.append(ProductMatch(id=product_id, name=names[product_id]))
+            position += 1
+
+    return matches
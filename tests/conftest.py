@@ -0,0 +1,13 @@
+import pytest
+from database.db import create_tables
+from services.search_service import invalidate_product_index
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Run each test against a fresh SQLite file in a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    create_tables()
+    invalidate_product_index()
+    yield tmp_path
+    invalidate_product_index()
@@ -0,0 +1,103 @@
+import sqlite3
+from services.inventory_service import (
+    Product,
+    add_product,
+    delete_product,
+    get_changes_since,
+    get_product,
+    update_stock,
+)
+
+
+def _changes(cursor=0, batch_size=500):
+    return [
+        (c.product_id, c.change_type, c.product)
+        for c in get_changes_since(cursor, batch_size)
+    ]
+
+
+def test_update_sets_updated_at(db):
+    add_product("Blue Widget", 1, 1.0)
+    conn = sqlite3.connect("inventory.db")
+    conn.execute("UPDATE products SET updated_at = '2000-01-01' WHERE id = 1")
+    conn.commit()
+    conn.close()
+
+    update_stock(1, 5)
+
+    conn = sqlite3.connect("inventory.db")
+    updated_at = conn.execute("SELECT updated_at FROM products").fetchone()[0]
+    conn.close()
+    assert updated_at != "2000-01-01"
+
+
+def test_update_with_recursive_triggers(db, monkeypatch):
+    connect = sqlite3.connect
+
+    def connect_with_recursive_triggers(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.execute("PRAGMA recursive_triggers = ON")
+        return conn
+
+    monkeypatch.setattr(sqlite3, "connect", connect_with_recursive_triggers)
+
+    add_product("Blue Widget", 1, 1.0)
+    update_stock(1, 5)
+
+    monkeypatch.setattr(sqlite3, "connect", connect)
+    assert get_product(1).quantity == 5
+
+
+def test_changes_follow_write_order(db):
+    add_product("Blue Widget", 1, 1.0)
+    add_product("Red Gadget", 2, 2.0)
+    add_product("Green Gizmo", 3, 3.0)
+    update_stock(1, 10)
+    delete_product(2)
+
+    assert _changes() == [
+        (3, "insert", Product(id=3, name="Green Gizmo", quantity=3, price=3.0)),
+        (1, "update", Product(id=1, name="Blue Widget", quantity=10, price=1.0)),
+        (2, "delete", None),
+    ]
+
+
+def test_change_log_keeps_latest_row_per_product(db):
+    add_product("Blue Widget", 1, 1.0)
+    for quantity in range(5):
+        update_stock(1, quantity)
+
+    conn = sqlite3.connect("inventory.db")
+    count = conn.execute("SELECT COUNT(*) FROM product_changes").fetchone()[0]
+    conn.close()
+    assert count == 1
+    assert _changes() == [
+        (1, "update", Product(id=1, name="Blue Widget", quantity=4, price=1.0))
+    ]
+
+
+def test_changes_resume_from_cursor(db):
+    add_product("Blue Widget", 1, 1.0)
+    add_product("Red Gadget", 2, 2.0)
+    cursor = list(get_changes_since())[-1].cursor
+
+    assert _changes(cursor) == []
+
+    update_stock(1, 7)
+    delete_product(2)
+
+    assert _changes(cursor) == [
+        (1, "update", Product(id=1, name="Blue Widget", quantity=7, price=1.0)),
+        (2, "delete", None),
+    ]
+
+
+def test_changes_page_across_batches(db):
+    for i in range(7):
+        add_product(f"Item {i}", i, 1.0)
+
+    changes = list(get_changes_since(batch_size=3))
+
+    assert [c.product_id for c in changes] == list(range(1, 8))
+    assert [c.cursor for c in changes] == sorted(c.cursor for c in changes)
+    assert _changes(batch_size=7) == _changes(batch_size=3)
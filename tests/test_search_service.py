@@ -0,0 +1,94 @@
+import sqlite3
+from services.inventory_service import add_product, delete_product, update_stock
+from services.search_service import (
+    ProductMatch,
+    invalidate_product_index,
+    search_product_index,
+)
+
+
+def test_matches_id_prefix(db):
+    for _ in range(12):
+        add_product("Item", 1, 1.0)
+
+    ids = [m.id for m in search_product_index("1")]
+
+    assert ids == [1, 10, 11, 12]
+
+
+def test_matches_full_name_and_word(db):
+    add_product("Blue Widget", 1, 1.0)
+    add_product("Red Gadget", 1, 1.0)
+
+    assert search_product_index("blue w") == [ProductMatch(id=1, name="Blue Widget")]
+    assert search_product_index("WID") == [ProductMatch(id=1, name="Blue Widget")]
+    assert search_product_index("gad") == [ProductMatch(id=2, name="Red Gadget")]
+
+
+def test_matches_word_inside_punctuated_name(db):
+    add_product("Widget-Pro X", 1, 1.0)
+
+    assert search_product_index("pro") == [ProductMatch(id=1, name="Widget-Pro X")]
+
+
+def test_deduplicates_products_with_several_matching_keys(db):
+    add_product("Bolt Bolt-Cutter", 1, 1.0)
+
+    assert search_product_index("bolt") == [
+        ProductMatch(id=1, name="Bolt Bolt-Cutter")
+    ]
+
+
+def test_honors_limit(db):
+    for i in range(30):
+        add_product(f"Screw {i}", 1, 1.0)
+
+    assert len(search_product_index("screw")) == 20
+    assert len(search_product_index("screw", limit=5)) == 5
+
+
+def test_no_match_returns_empty_list(db):
+    add_product("Blue Widget", 1, 1.0)
+
+    assert search_product_index("zzz") == []
+
+
+def test_writes_update_loaded_index(db):
+    add_product("Blue Widget", 1, 1.0)
+    assert [m.id for m in search_product_index("")] == [1]
+
+    add_product("Green Widget", 1, 1.0)
+    assert [m.id for m in search_product_index("widget")] == [1, 2]
+
+    delete_product(1)
+    assert search_product_index("blue") == []
+    assert [m.id for m in search_product_index("widget")] == [2]
+
+
+def test_stock_update_keeps_index(db, monkeypatch):
+    import services.search_service as search_service
+
+    add_product("Blue Widget", 1, 1.0)
+    search_product_index("")
+    monkeypatch.setattr(search_service, "_build_index", None)
+
+    update_stock(1, 50)
+
+    assert search_product_index("blue") == [ProductMatch(id=1, name="Blue Widget")]
+
+
+def test_rebuilds_after_invalidation(db):
+    add_product("Blue Widget", 1, 1.0)
+    search_product_index("")
+
+    conn = sqlite3.connect("inventory.db")
+    conn.execute("UPDATE products SET name = 'Yellow Widget' WHERE id = 1")
+    conn.commit()
+    conn.close()
+    assert search_product_index("yellow") == []
+
+    invalidate_product_index()
+
+    assert search_product_index("yellow") == [
+        ProductMatch(id=1, name="Yellow Widget")
+    ]